@@ -18,7 +18,7 @@ def main():
         logging.info("Application started successfully.")
         sys.exit(app.exec_())
     except Exception as e:
-        logging.error(f"An error occurred: {e}")
+        logging.error("An error occurred: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
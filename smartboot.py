@@ -29,6 +29,7 @@ class SmartBootUI(QWidget):
         self.create_tray_menu()
 
         self.iso_list = []
+        self.drive_path = ""
         self.initUI()
 
     def closeEvent(self, event):
@@ -138,10 +139,14 @@ class SmartBootUI(QWidget):
     def get_removable_drives(self):
         """Get a list of removable drives (USB drives) on the system."""
         removable_drives = []
-        drives = [f"{chr(d)}:\\" for d in range(65, 91)]  # Drive letters from A to Z
-        for drive in drives:
-            if os.path.exists(drive) and self.is_removable_drive(drive):
-                removable_drives.append(drive)
+        if not hasattr(ctypes, "windll"):  # Drive letters only exist on Windows
+            return removable_drives
+        drive_mask = ctypes.windll.kernel32.GetLogicalDrives()  # One bit per present drive letter, A = bit 0
+        for index in range(26):
+            if drive_mask & (1 << index):
+                drive = f"{chr(65 + index)}:\\"
+                if self.is_removable_drive(drive):
+                    removable_drives.append(drive)
         return removable_drives
 
     def is_removable_drive(self, drive):
@@ -178,7 +183,8 @@ class SmartBootUI(QWidget):
         if event.mimeData().hasUrls():
             for url in event.mimeData().urls():
                 path = url.toLocalFile()
-                if os.path.isfile(path) and path.endswith('.iso'):
+                # Cheap suffix check first (case-insensitive) so non-ISO drops skip the stat call
+                if path[-4:].lower() == '.iso' and os.path.isfile(path):
                     self.add_iso_file(path)
                     break
             else:
@@ -205,9 +211,9 @@ class SmartBootUI(QWidget):
             self.add_iso_file(iso_file)  # Call the method to add the ISO file
 
     def confirm_create_bootable(self):
-        drive_path = self.drive_combo.currentText()  # Get selected drive from ComboBox
+        self.drive_path = self.drive_combo.currentText()  # Resolve selected drive once for this run
         
-        if not drive_path:
+        if not self.drive_path:
             QMessageBox.warning(self, "Error", "Please select a USB drive.")
             return
         
@@ -246,7 +252,7 @@ class SmartBootUI(QWidget):
     def create_preview_message(self):
         """Create a preview message for the confirmation dialog."""
         return (f"ISO Files: {', '.join(self.iso_list)}\n"
-                f"Selected Drive: {self.drive_combo.currentText()}\n"
+                f"Selected Drive: {self.drive_path}\n"
                 f"Bootloader Type: {self.selected_boot_type}\n"
                 f"Filesystem: {self.file_system}\n"
                 f"Partition Scheme: {self.selected_partition_scheme}")
@@ -268,7 +274,7 @@ class SmartBootUI(QWidget):
         # Proceed with setting arguments for the USBWorker
         self.worker.set_arguments(
             self.iso_list,
-            self.drive_combo.currentText(),
+            self.drive_path,
             self.file_system,
             "BOOTABLE",  # Example volume label
             "sdb",        # Example selected device; consider making this dynamic
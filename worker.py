@@ -7,6 +7,72 @@ from PyQt5.QtWidgets import (QApplication, QLabel, QMainWindow, QPushButton,
 from PyQt5.QtCore import QThread, pyqtSignal
 import platform
 import ctypes
+import functools
+import shutil
+import time
+
+# Host platform, fixed for the lifetime of the process
+SYSTEM = platform.system()
+
+# Boot type -> tool its bootloader installer runs
+BOOTLOADER_TOOLS = {
+    "UEFI": "grub-install",
+    "Legacy": "syslinux",
+}
+
+# Stops console tools spawned from the GUI flashing a console window on Windows; 0 elsewhere
+NO_WINDOW_FLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+# File systems format_on_linux can create with mkfs
+LINUX_FILESYSTEMS = frozenset({"vfat", "ntfs", "ext2", "ext3", "ext4"})
+
+# Minimum seconds between small intermediate progress signals sent to the UI thread
+PROGRESS_INTERVAL = 0.05
+
+# Progress jumps of at least this many percent are sent even inside PROGRESS_INTERVAL
+PROGRESS_MIN_DELTA = 5
+
+# Default and largest block size used to stream ISO images onto the drive
+DEFAULT_COPY_BLOCK_SIZE = 1 << 20
+MAX_COPY_BLOCK_SIZE = 64 << 20
+
+# Bytes written between fsyncs, so progress tracks data that has reached the drive rather than the page cache
+COPY_SYNC_INTERVAL = 64 << 20
+
+# Block size from SMARTBOOT_BLOCK_SIZE (bytes, or with a K/M suffix like "4M"), else the 1 MiB default.
+# Read per run rather than at import so the warning goes through the application's logging setup.
+def get_copy_block_size():
+    value = os.environ.get("SMARTBOOT_BLOCK_SIZE", "").strip().upper()
+    if not value:
+        return DEFAULT_COPY_BLOCK_SIZE
+    multiplier = {"K": 1 << 10, "M": 1 << 20}.get(value[-1], 1)
+    digits = value[:-1] if multiplier > 1 else value
+    if digits.isdecimal() and 0 < int(digits) * multiplier <= MAX_COPY_BLOCK_SIZE:
+        return int(digits) * multiplier
+    logging.warning("Ignoring invalid SMARTBOOT_BLOCK_SIZE %r (expected 1 byte to 64M)", value)
+    return DEFAULT_COPY_BLOCK_SIZE
+
+# Tool name -> resolved path; only hits are stored so a tool installed while the app is open is found on retry
+_tool_paths = {}
+
+# Resolve a tool on PATH, reusing earlier hits; None if it is not installed
+def find_tool(tool):
+    path = _tool_paths.get(tool)
+    if path is None:
+        path = shutil.which(tool)
+        if path is not None:
+            _tool_paths[tool] = path
+    return path
+
+# Administrator (root on POSIX) check; privileges cannot change within a process
+@functools.lru_cache(maxsize=1)
+def is_admin():
+    if hasattr(os, "geteuid"):
+        return os.geteuid() == 0
+    try:
+        return bool(ctypes.windll.shell32.IsUserAnAdmin())
+    except Exception:
+        return False
 
 # USBWorker thread for handling USB creation
 class USBWorker(QThread):
@@ -24,6 +90,9 @@ class USBWorker(QThread):
         self.selected_device = ''
         self.selected_boot_type = ''
         self.selected_partition_scheme = ''
+        self.last_progress = -1
+        self.last_progress_time = 0.0
+        self.copy_block_size = DEFAULT_COPY_BLOCK_SIZE
 
     # Set arguments for USB creation process
     def set_arguments(self, iso_list, drive_path, file_system, volume_label, 
@@ -43,15 +112,18 @@ class USBWorker(QThread):
             self.usb_creation_completed.emit()
         except Exception as e:
             self.error_occurred.emit(str(e))
-            logging.error(f"Error during USB creation: {e}")
+            logging.error("Error during USB creation: %s", e)
 
     # Check system requirements
     def check_system_requirements(self):
+        # A missing drive makes every later step fail, so reject it before anything else runs
+        if not self.drive_path or not os.path.exists(self.drive_path):
+            raise FileNotFoundError(f"USB drive not found: {self.drive_path}")
+
         if not self.is_user_admin():
             raise PermissionError("Administrative privileges are required.")
 
-        required_tools = ["dd", "mkfs.ext4", "mkfs.ntfs", "grub-install", "syslinux"]
-        missing_tools = [tool for tool in required_tools if not self.is_tool_installed(tool)]
+        missing_tools = [tool for tool in self.get_required_tools() if not self.is_tool_installed(tool)]
 
         if missing_tools:
             raise EnvironmentError(f"Required tools are missing: {', '.join(missing_tools)}")
@@ -62,16 +134,31 @@ class USBWorker(QThread):
         if drive_space < required_space:
             raise ValueError(f"Insufficient space: Required {required_space} bytes, Available {drive_space} bytes.")
 
-    # Check if the script is running as an administrator
+        # Settle the block size before formatting so a bad setting is reported before the drive is wiped
+        self.copy_block_size = get_copy_block_size()
+
+    # Only the tools this run will actually invoke for the selected file system and boot type
+    def get_required_tools(self):
+        tools = []
+        file_system = self.file_system.lower()
+        # Unsupported file systems are rejected by format_on_linux, not reported as a missing mkfs
+        if SYSTEM != "Windows" and file_system in LINUX_FILESYSTEMS:
+            tools.append("mkfs." + file_system)
+        if self.selected_boot_type in BOOTLOADER_TOOLS:
+            tools.append(BOOTLOADER_TOOLS[self.selected_boot_type])
+        return tools
+
+    # Check if the script is running as an administrator (root on POSIX)
     def is_user_admin(self):
-        try:
-            return ctypes.windll.shell32.IsUserAnAdmin()
-        except:
-            return False
+        return is_admin()
 
     # Verify if the necessary system tool is available
     def is_tool_installed(self, tool):
-        return subprocess.call(["which", tool], stdout=subprocess.PIPE, stderr=subprocess.PIPE) == 0
+        return find_tool(tool) is not None
+
+    # Absolute path of a tool so subprocess calls skip the PATH search
+    def tool_path(self, tool):
+        return find_tool(tool) or tool
 
     # Get available space on the USB drive
     def get_free_space(self, drive_path):
@@ -83,37 +170,91 @@ class USBWorker(QThread):
         total_size = sum(os.path.getsize(iso_path) for iso_path in iso_list)
         return total_size
 
-    # Manage the overall process of creating the bootable USB
+    # Emit progress, dropping repeats and small updates that arrive faster than the UI can paint;
+    # force bypasses the throttle for stage boundaries
+    def update_progress(self, percent, force=False):
+        now = time.monotonic()
+        if percent == self.last_progress:
+            return
+        if (not force and percent not in (0, 100)
+                and now - self.last_progress_time < PROGRESS_INTERVAL
+                and abs(percent - self.last_progress) < PROGRESS_MIN_DELTA):
+            return
+        self.last_progress = percent
+        self.last_progress_time = now
+        self.progress_update.emit(percent)
+
+    # Creation pipeline: (step method name, progress reported once it finishes)
+    CREATION_STEPS = (
+        ("format_usb_drive", 10),
+        ("copy_iso_to_usb", 90),
+        ("install_bootloader", 100),
+    )
+
+    # Manage the overall process of creating the bootable USB; errors propagate to run()
     def create_bootable_usb(self):
-        self.format_usb_drive()
-        self.copy_iso_to_usb()
-        self.install_bootloader()
+        self.last_progress = -1
+        self.update_progress(0)
+        for step, percent in self.CREATION_STEPS:
+            getattr(self, step)()
+            self.update_progress(percent, force=True)
 
     # Format the USB drive
     def format_usb_drive(self):
-        if platform.system() == "Windows":
+        if SYSTEM == "Windows":
             self.format_on_windows()
         else:
             self.format_on_linux()
 
     def format_on_windows(self):
-        import wmi
-        c = wmi.WMI()
-        selected_disk = self.get_selected_disk_windows(c)
-        if not selected_disk:
+        drive_letter = os.path.splitdrive(self.drive_path)[0].rstrip(":")
+        if not drive_letter:
             raise ValueError("Disk not found.")
-        selected_disk.FormatFileSystem(Format=self.file_system, QuickFormat=True, VolumeName=self.volume_label)
+        label = self.volume_label.replace("'", "''")
+        script = (f"Format-Volume -DriveLetter {drive_letter} -FileSystem {self.file_system} "
+                  f"-NewFileSystemLabel '{label}' -Force -Confirm:$false")
+        subprocess.run([self.tool_path("powershell"), "-NoProfile", "-NonInteractive", "-Command", script],
+                       check=True, creationflags=NO_WINDOW_FLAGS)
 
     def format_on_linux(self):
-        supported_filesystems = ["vfat", "ntfs", "ext2", "ext3", "ext4"]
-        if self.file_system.lower() not in supported_filesystems:
+        file_system = self.file_system.lower()
+        if file_system not in LINUX_FILESYSTEMS:
             raise ValueError(f"Unsupported file system: {self.file_system}")
-        subprocess.run(["mkfs." + self.file_system, "-n", self.volume_label, self.drive_path], check=True)
+        command = [self.tool_path("mkfs." + file_system)]
+        if file_system == "vfat":
+            command += ["-I", "-n", self.volume_label]
+        elif file_system == "ntfs":
+            command += ["--fast", "--force", "--label", self.volume_label]
+        else:
+            # Leave inode table (and journal) zeroing to the kernel so large drives are usable sooner
+            lazy_init = "lazy_itable_init=1" if file_system == "ext2" else "lazy_itable_init=1,lazy_journal_init=1"
+            command += ["-F", "-E", lazy_init, "-L", self.volume_label]
+        command.append(self.drive_path)
+        subprocess.run(command, check=True)
 
-    # Copy ISO files to the USB drive
+    # Copy ISO files to the USB drive in large blocks, mapping bytes written onto the 10-90% progress range
     def copy_iso_to_usb(self):
+        total_size = max(self.estimate_iso_size(self.iso_list), 1)
+        copied = 0
+        buffer = bytearray(self.copy_block_size)
+        view = memoryview(buffer)
         for iso in self.iso_list:
-            subprocess.run(["dd", f"if={iso}", f"of={self.drive_path}", "bs=4M", "conv=fdatasync"], check=True)
+            with open(iso, "rb", buffering=0) as source, open(self.drive_path, "wb") as target:
+                unsynced = 0
+                while True:
+                    count = source.readinto(buffer)
+                    if not count:
+                        break
+                    target.write(view[:count])
+                    copied += count
+                    unsynced += count
+                    if unsynced >= COPY_SYNC_INTERVAL:
+                        target.flush()
+                        os.fsync(target.fileno())
+                        unsynced = 0
+                    self.update_progress(10 + 80 * copied // total_size)
+                target.flush()
+                os.fsync(target.fileno())
 
     def install_bootloader(self):
         if self.selected_boot_type == "UEFI":
@@ -122,10 +263,10 @@ class USBWorker(QThread):
             self.install_syslinux()
 
     def install_grub(self):
-        subprocess.run(["grub-install", "--target=x86_64-efi", "--removable", self.drive_path], check=True)
+        subprocess.run([self.tool_path("grub-install"), "--target=x86_64-efi", "--removable", self.drive_path], check=True)
 
     def install_syslinux(self):
-        subprocess.run(["syslinux", "--install", self.drive_path], check=True)
+        subprocess.run([self.tool_path("syslinux"), "--install", self.drive_path], check=True)
 
 
 # MainWindow class for handling the UI and interactions